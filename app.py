@@ -80,9 +80,9 @@ class TreeNode:
     value: int
     left: Optional['TreeNode'] = None
     right: Optional['TreeNode'] = None
-    x: float = 0.0
-    y: float = 0.0
     color: str = "#4CAF50"
+    size: int = 1
+    height: int = 1
 
 class BST:
     """Binary Search Tree class dengan visualisasi"""
@@ -101,7 +101,6 @@ class BST:
         else:
             self._insert_recursive(self.root, value, steps, "root")
         
-        self._calculate_positions()
         return steps
     
     def _insert_recursive(self, node: TreeNode, value: int, steps: List[str], position: str):
@@ -130,6 +129,8 @@ class BST:
                     self._insert_recursive(node.right, value, steps, f"kanan-{node.value}")
             else:
                 steps.append(f"⚠️ Nilai {value} sudah ada dalam tree! (Duplikat tidak diizinkan)")
+        
+        self._update_stats(node)
     
     def search(self, value: int) -> Tuple[bool, List[str]]:
         """Cari value dalam BST dan return hasil + langkah"""
@@ -159,7 +160,6 @@ class BST:
         """Hapus value dari BST"""
         steps = []
         self.root = self._delete_recursive(self.root, value, steps)
-        self._calculate_positions()
         return steps
     
     def _delete_recursive(self, node: Optional[TreeNode], value: int, steps: List[str]) -> Optional[TreeNode]:
@@ -195,6 +195,7 @@ class BST:
             
             node.right = self._delete_recursive(node.right, successor.value, steps)
         
+        self._update_stats(node)
         return node
     
     def _find_min(self, node: TreeNode) -> TreeNode:
@@ -237,49 +238,110 @@ class BST:
     
     def get_height(self) -> int:
         """Dapatkan tinggi tree"""
-        return self._height_recursive(self.root)
-    
-    def _height_recursive(self, node: Optional[TreeNode]) -> int:
-        if node is None:
-            return 0
-        return 1 + max(self._height_recursive(node.left), self._height_recursive(node.right))
+        return self._height(self.root)
     
     def get_node_count(self) -> int:
         """Dapatkan jumlah node"""
-        return self._count_nodes(self.root)
+        return self._size(self.root)
     
-    def _count_nodes(self, node: Optional[TreeNode]) -> int:
-        if node is None:
-            return 0
-        return 1 + self._count_nodes(node.left) + self._count_nodes(node.right)
+    @staticmethod
+    def _height(node: Optional[TreeNode]) -> int:
+        return node.height if node else 0
     
-    def _calculate_positions(self):
-        """Hitung posisi node untuk visualisasi"""
-        if self.root is None:
-            return
-        
-        # Hitung lebar total yang dibutuhkan
-        height = self.get_height()
-        width = 2 ** height
-        
-        self._assign_positions(self.root, 0, width, height - 1)
+    @staticmethod
+    def _size(node: Optional[TreeNode]) -> int:
+        return node.size if node else 0
     
-    def _assign_positions(self, node: TreeNode, left: float, right: float, level: int):
-        """Assign posisi x,y untuk setiap node"""
+    def _update_stats(self, node: TreeNode):
+        """Perbarui ukuran dan tinggi subtree yang disimpan di node"""
+        node.size = 1 + self._size(node.left) + self._size(node.right)
+        node.height = 1 + max(self._height(node.left), self._height(node.right))
+    
+    def get_subtree(self, path: str) -> Tuple[Optional[TreeNode], str]:
+        """Ambil node dari path 'L'/'R' relatif ke root, berhenti di node terdalam yang masih ada"""
+        node = self.root
         if node is None:
-            return
-        
-        node.x = (left + right) / 2
-        node.y = level
-        
-        mid = (left + right) / 2
-        if node.left:
-            self._assign_positions(node.left, left, mid, level - 1)
-        if node.right:
-            self._assign_positions(node.right, mid, right, level - 1)
+            return None, ""
+        walked = ""
+        for step in path:
+            child = node.left if step == "L" else node.right
+            if child is None:
+                break
+            node = child
+            walked += step
+        return node, walked
+    
+    def find_path(self, value: int) -> Optional[str]:
+        """Cari path 'L'/'R' dari root ke node dengan nilai tertentu"""
+        node = self.root
+        path = ""
+        while node is not None:
+            if value == node.value:
+                return path
+            if value < node.value:
+                node, path = node.left, path + "L"
+            else:
+                node, path = node.right, path + "R"
+        return None
+    
+    def layout_viewport(self, path: str = "", max_depth: int = 4) -> dict:
+        """Hitung posisi node yang terlihat: max_depth level dari subtree di path.
+        
+        Subtree di bawah batas kedalaman tidak dikunjungi, hanya diringkas
+        sebagai glyph dengan jumlah node dan tingginya, sehingga kerja
+        sebanding dengan node yang terlihat, bukan dengan ukuran tree.
+        """
+        focus, path = self.get_subtree(path)
+        viewport = {'focus': focus, 'path': path, 'nodes': [], 'collapsed': [], 'edges': [], 'levels': 0}
+        if focus is None:
+            return viewport
+        
+        levels = min(max_depth, focus.height)
+        viewport['levels'] = levels
+        base_depth = len(path)
+        
+        # BFS per level, setiap item: (node, path, kiri, kanan, kedalaman relatif)
+        frontier = [(focus, path, 0.0, float(2 ** levels), 0)]
+        while frontier:
+            next_frontier = []
+            for node, node_path, left, right, depth in frontier:
+                x = (left + right) / 2
+                info = {
+                    'x': x,
+                    'y': -depth,
+                    'value': node.value,
+                    'color': node.color,
+                    'path': node_path,
+                    'depth': base_depth + depth,
+                    'size': node.size,
+                    'height': node.height
+                }
+                
+                # Leaf di batas kedalaman tetap digambar sebagai node biasa
+                if depth == levels and node.size > 1:
+                    viewport['collapsed'].append(info)
+                    continue
+                viewport['nodes'].append(info)
+                
+                for child, step, c_left, c_right in ((node.left, "L", left, x), (node.right, "R", x, right)):
+                    if child is None:
+                        continue
+                    viewport['edges'].append({
+                        'x0': x, 'y0': -depth,
+                        'x1': (c_left + c_right) / 2, 'y1': -(depth + 1),
+                        'collapsed': depth + 1 == levels and child.size > 1
+                    })
+                    next_frontier.append((child, node_path + step, c_left, c_right, depth + 1))
+            frontier = next_frontier
+        
+        return viewport
 
-def create_tree_visualization(bst: BST, dark_mode: bool = True) -> go.Figure:
-    """Buat visualisasi tree menggunakan Plotly dengan opsi background"""
+def create_tree_visualization(bst: BST, dark_mode: bool = True, focus_path: str = "", max_depth: int = 4) -> go.Figure:
+    """Buat visualisasi tree menggunakan Plotly dengan opsi background.
+    
+    Hanya max_depth level dari subtree di focus_path yang digambar; subtree
+    di bawahnya ditampilkan sebagai glyph ringkasan (jumlah node & tinggi).
+    """
     
     # Tentukan warna berdasarkan mode
     if dark_mode:
@@ -289,6 +351,7 @@ def create_tree_visualization(bst: BST, dark_mode: bool = True) -> go.Figure:
         edge_color = '#E0E0E0'
         empty_text_color = '#cccccc'
         title_color = '#ffffff'
+        collapsed_color = '#FF9800'
     else:
         bg_color = 'white'
         paper_bg = '#f8f9fa'
@@ -296,6 +359,7 @@ def create_tree_visualization(bst: BST, dark_mode: bool = True) -> go.Figure:
         edge_color = '#666666'
         empty_text_color = '#666666'
         title_color = '#2E4057'
+        collapsed_color = '#F57C00'
     
     if bst.root is None:
         fig = go.Figure()
@@ -320,80 +384,88 @@ def create_tree_visualization(bst: BST, dark_mode: bool = True) -> go.Figure:
         )
         return fig
     
-    # Kumpulkan semua node
-    nodes = []
-    edges = []
+    viewport = bst.layout_viewport(focus_path, max_depth)
+    nodes = viewport['nodes']
+    collapsed = viewport['collapsed']
+    levels = viewport['levels']
     
-    def collect_nodes(node: TreeNode):
-        if node is None:
-            return
-        
-        nodes.append({
-            'x': node.x,
-            'y': node.y,
-            'value': node.value,
-            'color': node.color
-        })
-        
-        if node.left:
-            edges.append({
-                'x0': node.x, 'y0': node.y,
-                'x1': node.left.x, 'y1': node.left.y
-            })
-            collect_nodes(node.left)
-        
-        if node.right:
-            edges.append({
-                'x0': node.x, 'y0': node.y,
-                'x1': node.right.x, 'y1': node.right.y
-            })
-            collect_nodes(node.right)
-    
-    collect_nodes(bst.root)
+    # Ukuran marker mengecil jika baris terbawah padat; label nilai hanya
+    # ditampilkan jika masih muat di dalam marker, selebihnya lewat hover
+    slots = 2 ** levels
+    marker_size = max(12, min(40, 640 // slots))
+    show_labels = marker_size >= 40
+    font_size = 14
     
     fig = go.Figure()
     
-    # Tambahkan edges (garis penghubung)
-    for edge in edges:
-        fig.add_trace(go.Scatter(
-            x=[edge['x0'], edge['x1']],
-            y=[edge['y0'], edge['y1']],
-            mode='lines',
-            line=dict(color=edge_color, width=2),
-            showlegend=False,
-            hoverinfo='skip'
-        ))
+    # Tambahkan edges (garis penghubung) dalam satu trace per gaya garis
+    for is_collapsed, dash in ((False, 'solid'), (True, 'dot')):
+        edge_x, edge_y = [], []
+        for edge in viewport['edges']:
+            if edge['collapsed'] == is_collapsed:
+                edge_x += [edge['x0'], edge['x1'], None]
+                edge_y += [edge['y0'], edge['y1'], None]
+        if edge_x:
+            fig.add_trace(go.Scatter(
+                x=edge_x,
+                y=edge_y,
+                mode='lines',
+                line=dict(color=edge_color, width=2, dash=dash),
+                showlegend=False,
+                hoverinfo='skip'
+            ))
     
     # Tambahkan nodes
-    x_vals = [node['x'] for node in nodes]
-    y_vals = [node['y'] for node in nodes]
-    values = [node['value'] for node in nodes]
-    colors = [node['color'] for node in nodes]
-    
     fig.add_trace(go.Scatter(
-        x=x_vals,
-        y=y_vals,
-        mode='markers+text',
+        x=[node['x'] for node in nodes],
+        y=[node['y'] for node in nodes],
+        mode='markers+text' if show_labels else 'markers',
         marker=dict(
-            size=40,
-            color=colors,
+            size=marker_size,
+            color=[node['color'] for node in nodes],
             line=dict(width=3, color='white'),
             opacity=0.9
         ),
-        text=values,
-        textfont=dict(size=14, color='white'),
+        text=[node['value'] for node in nodes],
+        customdata=[[node['path'], node['depth'], node['size'], node['height'], node['value']] for node in nodes],
+        textfont=dict(size=font_size, color='white'),
         textposition='middle center',
         showlegend=False,
-        hovertemplate='<b>Node: %{text}</b><br>Level: %{y}<extra></extra>'
+        hovertemplate='<b>Node: %{customdata[4]}</b><br>Level: %{customdata[1]}<br>Subtree: %{customdata[2]} node<extra></extra>'
     ))
     
+    # Tambahkan glyph untuk subtree yang diciutkan
+    if collapsed:
+        fig.add_trace(go.Scatter(
+            x=[node['x'] for node in collapsed],
+            y=[node['y'] for node in collapsed],
+            mode='markers+text' if show_labels else 'markers',
+            marker=dict(
+                symbol='triangle-down',
+                size=marker_size,
+                color=collapsed_color,
+                line=dict(width=2, color='white'),
+                opacity=0.9
+            ),
+            text=[f"{node['size']} node<br>h={node['height']}" for node in collapsed],
+            customdata=[[node['path'], node['depth'], node['size'], node['height'], node['value']] for node in collapsed],
+            textfont=dict(size=font_size - 2, color=text_color),
+            textposition='bottom center',
+            showlegend=False,
+            hovertemplate='<b>Subtree %{customdata[4]}</b><br>%{customdata[2]} node, tinggi %{customdata[3]}<br>Klik untuk membuka<extra></extra>'
+        ))
+    
+    title = "🌳 Binary Search Tree Visualization"
+    if viewport['path']:
+        title += f" — Subtree {viewport['focus'].value}"
+    
     fig.update_layout(
         title=dict(
-            text="🌳 Binary Search Tree Visualization",
+            text=title,
             font=dict(size=20, color=title_color)
         ),
         showlegend=False,
-        height=500,
+        height=max(500, 100 * (levels + 1)),
         paper_bgcolor=paper_bg,
         plot_bgcolor=bg_color,
         xaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
@@ -422,6 +494,10 @@ def main():
         st.session_state.allow_duplicates = False
     if 'dark_mode' not in st.session_state:
         st.session_state.dark_mode = True
+    if 'focus_path' not in st.session_state:
+        st.session_state.focus_path = ""
+    if 'max_depth' not in st.session_state:
+        st.session_state.max_depth = 4
     
     # Sidebar untuk kontrol
     with st.sidebar:
@@ -457,6 +533,31 @@ def main():
             st.session_state.bst.allow_duplicates = new_allow_duplicates
             st.session_state.operation_history.append(f"⚙️ Pengaturan duplikat: {'Diizinkan' if new_allow_duplicates else 'Tidak diizinkan'}")
         
+        # Pengaturan viewport untuk tree besar
+        st.markdown("#### 🔭 Viewport")
+        st.slider("Kedalaman tampilan", min_value=1, max_value=6, key="max_depth",
+                  help="Subtree di bawah kedalaman ini diciutkan menjadi ringkasan")
+        
+        focus_value = st.number_input("Fokus ke subtree:", min_value=-1000, max_value=1000, value=0, key="focus_input")
+        if st.button("🎯 Fokus", key="focus_btn"):
+            path = st.session_state.bst.find_path(focus_value)
+            if path is None:
+                st.error(f"❌ Nilai {focus_value} tidak ditemukan!")
+            else:
+                st.session_state.focus_path = path
+                st.rerun()
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.button("⬆️ Naik", key="focus_up_btn", help="Pindah ke parent dari subtree saat ini"):
+                st.session_state.focus_path = st.session_state.focus_path[:-1]
+                st.rerun()
+        
+        with col2:
+            if st.button("🏠 Root", key="focus_root_btn", help="Tampilkan tree dari root"):
+                st.session_state.focus_path = ""
+                st.rerun()
+        
         st.markdown("---")
         
         # Insert node
@@ -506,6 +607,7 @@ def main():
         with col1:
             if st.button("🔥 Clear All", key="clear_btn"):
                 st.session_state.bst = BST(allow_duplicates=st.session_state.allow_duplicates)
+                st.session_state.focus_path = ""
                 st.session_state.operation_history = ["🧹 Tree telah dikosongkan!"]
                 st.rerun()
         
@@ -523,8 +625,20 @@ def main():
     with col1:
         # Visualisasi tree
         st.subheader("🎨 Visualisasi Tree")
-        fig = create_tree_visualization(st.session_state.bst, st.session_state.dark_mode)
-        st.plotly_chart(fig, use_container_width=True)
+        # Path fokus bisa tidak valid lagi setelah delete, sesuaikan ke node terdalam yang ada
+        _, st.session_state.focus_path = st.session_state.bst.get_subtree(st.session_state.focus_path)
+        fig = create_tree_visualization(st.session_state.bst, st.session_state.dark_mode,
+                                        st.session_state.focus_path, st.session_state.max_depth)
+        
+        # Key berubah tiap fokus berubah agar seleksi lama tidak diterapkan ulang
+        event = st.plotly_chart(fig, use_container_width=True, on_select="rerun", selection_mode="points",
+                                key=f"tree_chart_{st.session_state.focus_path}_{st.session_state.max_depth}")
+        points = event.selection.points if event else []
+        if points and points[0].get("customdata"):
+            clicked_path = points[0]["customdata"][0]
+            if clicked_path != st.session_state.focus_path:
+                st.session_state.focus_path = clicked_path
+                st.rerun()
         
         # Statistik BST
         if st.session_state.bst.root is not None:
@@ -637,6 +751,11 @@ def main():
         **Fitur Background:**
         - 🌙 **Dark Mode**: Background gelap untuk kenyamanan mata
         - ☀️ **Light Mode**: Background terang untuk presentasi yang lebih cerah
+        
+        **Viewport Tree Besar:**
+        - 🔭 **Kedalaman tampilan**: Hanya sejumlah level teratas yang digambar
+        - 🔻 **Glyph ringkasan**: Subtree yang diciutkan menampilkan jumlah node dan tingginya
+        - 🎯 **Drill-down**: Klik node atau glyph untuk membuka subtree, gunakan ⬆️ Naik / 🏠 Root untuk kembali
         """)
     
     # Credit
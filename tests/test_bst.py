@@ -0,0 +1,83 @@
+from app import BST
+
+
+def build(values, allow_duplicates=False):
+    bst = BST(allow_duplicates=allow_duplicates)
+    for value in values:
+        bst.insert(value)
+    return bst
+
+
+def check_stats(node):
+    """Hitung ulang size/height secara rekursif dan bandingkan dengan nilai yang disimpan"""
+    if node is None:
+        return 0, 0
+    left_size, left_height = check_stats(node.left)
+    right_size, right_height = check_stats(node.right)
+    size = 1 + left_size + right_size
+    height = 1 + max(left_height, right_height)
+    assert (node.size, node.height) == (size, height), node.value
+    return size, height
+
+
+SAMPLE = [50, 30, 70, 20, 40, 60, 80, 10, 25]
+
+
+def test_stats_after_insert():
+    bst = build(SAMPLE)
+    check_stats(bst.root)
+    assert bst.get_node_count() == 9
+    assert bst.get_height() == 4
+
+
+def test_stats_after_duplicate_insert():
+    bst = build(SAMPLE + [70, 70], allow_duplicates=True)
+    check_stats(bst.root)
+    assert bst.get_node_count() == 11
+
+    bst = build(SAMPLE + [70])
+    check_stats(bst.root)
+    assert bst.get_node_count() == 9
+
+
+def test_stats_after_delete():
+    bst = build(SAMPLE)
+
+    bst.delete(10)  # leaf
+    check_stats(bst.root)
+    bst.delete(20)  # satu anak
+    check_stats(bst.root)
+    bst.delete(50)  # dua anak
+    check_stats(bst.root)
+    bst.delete(999)  # tidak ada
+    check_stats(bst.root)
+
+    assert bst.get_node_count() == 6
+    assert bst.get_height() == 3
+
+
+def test_layout_viewport_collapses_below_depth():
+    bst = build(SAMPLE)
+    viewport = bst.layout_viewport("", max_depth=2)
+
+    assert viewport['levels'] == 2
+    assert sorted(node['value'] for node in viewport['nodes']) == [30, 40, 50, 60, 70, 80]
+    assert [(node['value'], node['size'], node['height']) for node in viewport['collapsed']] == [(20, 3, 2)]
+    assert len(viewport['edges']) == 6
+    assert sum(edge['collapsed'] for edge in viewport['edges']) == 1
+
+
+def test_layout_viewport_focus_subtree():
+    bst = build(SAMPLE)
+    viewport = bst.layout_viewport(bst.find_path(20), max_depth=4)
+
+    assert viewport['path'] == "LL"
+    assert sorted(node['value'] for node in viewport['nodes']) == [10, 20, 25]
+    assert viewport['collapsed'] == []
+    assert all(node['depth'] >= 2 for node in viewport['nodes'])
+
+
+def test_empty_tree_with_stale_path():
+    bst = BST()
+    assert bst.get_subtree("L") == (None, "")
+    assert bst.layout_viewport("L")['nodes'] == []